@@ -8,24 +8,65 @@ Provides liquidity 24/7, earns rewards, and avoids getting filled.
 import os
 import sys
 import json
+import heapq
 import time
 import math
+import queue
 import signal
+import threading
 import traceback
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
 
-# Force print to flush immediately (needed for Railway/Docker logs)
-import functools
-print = functools.partial(print, flush=True)
+# Flush output on every newline (needed for Railway/Docker logs).
+# Replaced/redirected streams may not support reconfigure; leave them as is.
+try:
+    sys.stdout.reconfigure(line_buffering=True)
+except (AttributeError, ValueError):
+    pass
 
 print("🔧 Bot starting up...")
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     print("  ✅ requests loaded")
 except ImportError as e:
     print(f"  ❌ Failed to import requests: {e}")
     sys.exit(1)
 
+try:
+    import numpy as np
+    print("  ✅ numpy loaded")
+except ImportError as e:
+    print(f"  ❌ Failed to import numpy: {e}")
+    sys.exit(1)
+
+try:
+    import orjson
+    json_loads = orjson.loads
+    print("  ✅ orjson loaded")
+except ImportError:
+    json_loads = json.loads
+    print("  ⚠ orjson not found, using stdlib json")
+
+try:
+    from ciso8601 import parse_datetime
+    print("  ✅ ciso8601 loaded")
+except ImportError:
+    parse_datetime = None
+    print("  ⚠ ciso8601 not found, using datetime.fromisoformat")
+
+try:
+    import websocket
+    print("  ✅ websocket-client loaded")
+except ImportError:
+    websocket = None
+    print("  ⚠ websocket-client not found, polling midpoints over REST")
+
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, field
 from typing import Optional
@@ -45,6 +86,13 @@ print(f"  SIG_TYPE: {os.getenv('SIGNATURE_TYPE', 'not set')}")
 
 GAMMA_API = "https://gamma-api.polymarket.com"
 CLOB_API = "https://clob.polymarket.com"
+CLOB_WS_MARKET = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+MARKETS_PAGE_LIMIT = 100                                               # Markets per /markets page
+PAGE_FETCH_WORKERS = 8                                                 # Pages fetched concurrently
+MIDPOINT_FETCH_WORKERS = 8                                             # Concurrent REST midpoint lookups
+ORDER_PLACEMENT_WORKERS = 8                                            # Markets placed concurrently
+PARSE_CACHE_SIZE = 8192                                                # Parsed markets kept between scans
+WS_PING_INTERVAL = 10                                                  # Seconds between websocket PINGs
 
 # Bot parameters (tweak these)
 DEFAULT_SIZE_PER_MARKET = float(os.getenv("SIZE_PER_MARKET", "500"))   # $500 per market
@@ -59,11 +107,30 @@ REFRESH_INTERVAL = int(os.getenv("REFRESH_INTERVAL", "60"))            # Seconds
 # Telegram config
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "")
+TELEGRAM_COALESCE_SECONDS = 0.5   # Alerts within this window go out as one message
+TELEGRAM_MAX_LENGTH = 4096        # Telegram's per-message text limit
+TELEGRAM_SEPARATOR = "\n---\n"
+TELEGRAM_TIMEOUT = 3              # Seconds; a stale alert isn't worth waiting for
+
+# Shared HTTP session: keeps TCP/TLS connections to the APIs alive across
+# pages and polling cycles instead of reconnecting on every request.
+SESSION = requests.Session()
+SESSION.headers.update({
+    "Accept-Encoding": "gzip",
+    "Connection": "keep-alive",
+    "User-Agent": "lp-bot/1.0",
+})
+for _base in (GAMMA_API, CLOB_API):
+    SESSION.mount(_base, HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    ))
 
 
 # ─── Data Classes ────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class RewardMarket:
     """A market eligible for LP rewards."""
     condition_id: str
@@ -86,7 +153,7 @@ class RewardMarket:
     risk_score: float         # 0-100, lower = safer
     reward_per_dollar: float  # Daily reward relative to required capital
 
-@dataclass
+@dataclass(slots=True)
 class ActivePosition:
     """A position we currently have on a market."""
     market: RewardMarket
@@ -99,22 +166,89 @@ class ActivePosition:
     fills_today: int = 0
     rewards_earned: float = 0.0
     risk_level: str = "LOW"
+    risk_idx: int = 4         # Index of risk_level in RISK_LEVELS; 4 = not yet checked
+    slot: int = -1            # Index into the _BIDS/_ASKS/_MIDS columns
 
 
 # ─── Telegram Notifications ─────────────────────────────────────────────────
 
+# Alerts are queued and posted by a background worker, so a slow Telegram
+# API never blocks the monitor loop. Alerts arriving within
+# TELEGRAM_COALESCE_SECONDS of each other are sent as one message.
+_TG_QUEUE: "queue.Queue[str]" = queue.Queue()
+_TG_LOCK = threading.Lock()
+_TG_THREAD: Optional[threading.Thread] = None
+# Messages queued but not yet posted; the worker notifies _TG_DONE after each batch.
+_TG_DONE = threading.Condition()
+_TG_PENDING = 0
+
+
 def send_telegram(message: str):
-    """Send a Telegram notification."""
+    """Queue a Telegram notification (sent in the background)."""
+    global _TG_THREAD, _TG_PENDING
     if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
         return
+    with _TG_LOCK:
+        if _TG_THREAD is None:
+            _TG_THREAD = threading.Thread(target=_tg_worker, name="telegram", daemon=True)
+            _TG_THREAD.start()
+    with _TG_DONE:
+        _TG_PENDING += 1
+    _TG_QUEUE.put(message)
+
+
+def flush_telegram(timeout: float = 5.0):
+    """Wait up to timeout seconds for queued notifications to go out."""
+    with _TG_DONE:
+        _TG_DONE.wait_for(lambda: _TG_PENDING == 0, timeout)
+
+
+def _tg_worker():
+    """Drain the queue, coalescing bursts into as few messages as possible."""
+    global _TG_PENDING
+    while True:
+        batch = [_TG_QUEUE.get()]
+        time.sleep(TELEGRAM_COALESCE_SECONDS)
+        while True:
+            try:
+                batch.append(_TG_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        
+        try:
+            for text in _coalesce_messages(batch):
+                _post_telegram(text)
+        finally:
+            with _TG_DONE:
+                _TG_PENDING -= len(batch)
+                _TG_DONE.notify_all()
+
+
+def _coalesce_messages(messages: list[str]) -> list[str]:
+    """Join messages, splitting so no chunk exceeds Telegram's length limit."""
+    chunks = []
+    current = ""
+    for msg in messages:
+        candidate = f"{current}{TELEGRAM_SEPARATOR}{msg}" if current else msg
+        if current and len(candidate) > TELEGRAM_MAX_LENGTH:
+            chunks.append(current)
+            current = msg
+        else:
+            current = candidate
+    chunks.append(current)
+    return chunks
+
+
+def _post_telegram(text: str):
+    """Send one message to the configured Telegram chat."""
     try:
         url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        requests.post(url, json={
+        SESSION.post(url, json={
             "chat_id": TELEGRAM_CHAT_ID,
-            "text": message,
+            "text": text,
             "parse_mode": "HTML",
             "disable_web_page_preview": True,
-        }, timeout=10)
+        }, timeout=TELEGRAM_TIMEOUT)
     except Exception as e:
         print(f"  ⚠ Telegram error: {e}")
 
@@ -124,73 +258,111 @@ def send_telegram(message: str):
 def gamma_get(endpoint: str, params: dict = None) -> dict:
     """Make a GET request to the Gamma API."""
     url = f"{GAMMA_API}{endpoint}"
-    resp = requests.get(url, params=params, timeout=30)
+    resp = SESSION.get(url, params=params, timeout=30)
     resp.raise_for_status()
-    return resp.json()
+    return json_loads(resp.content)
 
 def clob_get(endpoint: str, params: dict = None) -> dict:
     """Make a GET request to the CLOB API (public, no auth)."""
     url = f"{CLOB_API}{endpoint}"
-    resp = requests.get(url, params=params, timeout=30)
+    resp = SESSION.get(url, params=params, timeout=30)
     resp.raise_for_status()
-    return resp.json()
+    return json_loads(resp.content)
 
 
 # ─── Market Scanner ─────────────────────────────────────────────────────────
 
+def _fetch_page(offset: int, end_date_min: str) -> tuple[int, list]:
+    """Fetch one page of active markets ending after end_date_min."""
+    markets_raw = gamma_get("/markets", params={
+        "active": "true",
+        "closed": "false",
+        "end_date_min": end_date_min,
+        "limit": str(MARKETS_PAGE_LIMIT),
+        "offset": str(offset),
+    })
+    return offset, markets_raw
+
+
 def fetch_reward_markets() -> list[RewardMarket]:
     """
     Fetch all markets with active LP rewards and score them.
-    Returns markets sorted by attractiveness (best first).
+    Returns only the top max(20, 2 * MAX_MARKETS) opportunities that pass
+    the filters, ranked by reward_per_dollar (best first).
     """
     print("\n🔍 Scanning eligible reward markets...")
+    now_ts = time.time()
     
     # Strategy: fetch markets directly from /markets endpoint
     # which includes reward fields (rewardsMinSize, rewardsMaxSpread, rewards[])
-    all_markets = []
-    offset = 0
-    limit = 100
+    limit = MARKETS_PAGE_LIMIT
     
-    while True:
-        try:
-            markets_raw = gamma_get("/markets", params={
-                "active": "true",
-                "closed": "false",
-                "limit": str(limit),
-                "offset": str(offset),
-            })
-        except Exception as e:
-            print(f"  ⚠ Error fetching markets (offset={offset}): {e}")
-            break
-        
-        if not markets_raw:
-            break
-        
-        # Debug: print field names of first market to find reward fields
-        if offset == 0 and markets_raw:
-            first = markets_raw[0]
-            reward_fields = [k for k in first.keys() if 'reward' in k.lower() or 'incentive' in k.lower() or 'spread' in k.lower()]
-            print(f"  Reward-related fields found: {reward_fields}")
-            # Also check for nested rewards
-            if 'rewards' in first:
-                print(f"  rewards field type: {type(first['rewards'])}")
-                if first['rewards']:
-                    print(f"  rewards sample: {first['rewards'][:1] if isinstance(first['rewards'], list) else first['rewards']}")
-        
+    # Let the API drop markets resolving too soon (re-checked locally below)
+    min_end = datetime.fromtimestamp(now_ts, timezone.utc) + timedelta(days=MIN_DAYS_TO_RESOLUTION)
+    end_date_min = min_end.strftime("%Y-%m-%dT%H:%M:%SZ")
+    
+    # Probe with the first page, then fetch the rest in concurrent batches
+    try:
+        _, first_page = _fetch_page(0, end_date_min)
+    except Exception as e:
+        print(f"  ⚠ Error fetching markets (offset=0): {e}")
+        first_page = []
+    
+    # Debug: print field names of first market to find reward fields
+    if first_page:
+        first = first_page[0]
+        reward_fields = [k for k in first.keys() if 'reward' in k.lower() or 'incentive' in k.lower() or 'spread' in k.lower()]
+        print(f"  Reward-related fields found: {reward_fields}")
+        # Also check for nested rewards
+        if 'rewards' in first:
+            print(f"  rewards field type: {type(first['rewards'])}")
+            if first['rewards']:
+                print(f"  rewards sample: {first['rewards'][:1] if isinstance(first['rewards'], list) else first['rewards']}")
+        _detect_schema(first_page)
+    
+    pages = [first_page] if first_page else []
+    more = len(first_page) >= limit
+    next_offset = limit
+    
+    with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as pool:
+        while more:
+            offsets = [next_offset + i * limit for i in range(PAGE_FETCH_WORKERS)]
+            next_offset += PAGE_FETCH_WORKERS * limit
+            
+            futures = {pool.submit(_fetch_page, o, end_date_min): o for o in offsets}
+            batch = {}
+            for future in as_completed(futures):
+                offset = futures[future]
+                try:
+                    batch[offset] = future.result()[1]
+                except Exception as e:
+                    print(f"  ⚠ Error fetching markets (offset={offset}): {e}")
+                    batch[offset] = None
+            
+            # Keep pages in offset order and stop at the first short/failed one
+            for offset in offsets:
+                markets_raw = batch[offset]
+                if markets_raw:
+                    pages.append(markets_raw)
+                if not markets_raw or len(markets_raw) < limit:
+                    more = False
+                    break
+    
+    # Only markets that can carry a daily reward are worth extracting
+    rows = []
+    for markets_raw in pages:
         for market in markets_raw:
-            parsed = parse_market(market, {})
-            if parsed:
-                all_markets.append(parsed)
-        
-        if len(markets_raw) < limit:
-            break
-        offset += limit
-        time.sleep(0.3)  # Rate limit
+            if not _is_reward_candidate(market):
+                continue
+            fields = _extract_fields(market, {})
+            if fields:
+                rows.append(fields)
+    candidates = _build_markets(rows, now_ts)
     
     # Filter for reward-eligible markets
-    reward_markets = [m for m in all_markets if m.daily_reward > 0 and m.max_spread > 0]
+    reward_markets = [m for m in candidates if m.daily_reward > 0 and m.max_spread > 0]
     
-    print(f"  Found {len(all_markets)} active markets, {len(reward_markets)} with rewards")
+    print(f"  Found {sum(map(len, pages))} active markets, {len(reward_markets)} with rewards")
     
     # Apply our filters
     filtered = []
@@ -203,15 +375,106 @@ def fetch_reward_markets() -> list[RewardMarket]:
             continue
         filtered.append(m)
     
-    # Sort by risk-adjusted reward (best first)
-    filtered.sort(key=lambda m: m.reward_per_dollar, reverse=True)
-    
     print(f"  After filtering: {len(filtered)} opportunities match criteria")
-    return filtered
+    
+    # Keep only the top opportunities by risk-adjusted reward (best first);
+    # callers never look past the top 20 / MAX_MARKETS
+    return heapq.nlargest(max(20, MAX_MARKETS * 2), filtered, key=lambda m: m.reward_per_dollar)
+
+
+# Static market fields (ids, reward parameters, end date) keyed by
+# (market id, updatedAt), LRU-bounded. Prices, book, volume and liquidity
+# move without updatedAt changing, so they're read fresh every scan.
+_PARSE_CACHE: "OrderedDict[tuple[str, str], Optional[dict]]" = OrderedDict()
+
+# Numeric columns fed from _extract_fields into _score_batch
+_SCORE_INPUTS = (
+    "end_ts", "daily_reward", "min_size", "yes_price", "no_price",
+    "volume_24h", "liquidity", "best_bid", "best_ask",
+)
 
 
 def parse_market(market: dict, event: dict) -> Optional[RewardMarket]:
     """Parse a raw market dict into a RewardMarket."""
+    fields = _extract_fields(market, event)
+    if not fields:
+        return None
+    return _build_markets([fields], time.time())[0]
+
+
+# Field names each reward parameter has been seen under, in priority order
+_REWARD_FIELD_PATTERNS = {
+    "max_spread": ("rewardsMaxSpread", "rewards_max_spread", "max_incentive_spread"),
+    "min_size": ("rewardsMinSize", "rewards_min_size", "min_incentive_size"),
+    "rate": ("rewardsDailyRate", "dailyRate", "rewards_daily_rate"),  # inside rewards[]
+    "daily": ("rewardsDailyRate", "rewards_daily_rate"),               # top-level
+}
+
+# Keys actually probed per market. _detect_schema narrows each entry to the
+# single name the API is using; undetected fields keep the full ladder.
+_SCHEMA_KEYS = dict(_REWARD_FIELD_PATTERNS)
+
+
+def _detect_schema(markets: list[dict]):
+    """Specialize reward field lookups to the names used by this page."""
+    reward_items = [
+        r for m in markets if isinstance(m.get("rewards"), list)
+        for r in m["rewards"] if isinstance(r, dict)
+    ]
+    for name, keys in _REWARD_FIELD_PATTERNS.items():
+        samples = reward_items if name == "rate" else markets
+        found = next((k for k in keys if any(d.get(k) is not None for d in samples)), None)
+        _SCHEMA_KEYS[name] = (found,) if found else keys
+
+
+def _is_reward_candidate(market: dict) -> bool:
+    """Cheap pre-check: can this raw market have a non-zero daily reward?"""
+    if market.get("rewards"):
+        return True
+    return any(market.get(key) for key in _SCHEMA_KEYS["daily"])
+
+
+def _first_float(d: dict, keys: tuple) -> float:
+    """First non-zero value among keys, as a float (0 if none)."""
+    for key in keys:
+        value = float(d.get(key, 0) or 0)
+        if value:
+            return value
+    return 0.0
+
+
+def _extract_fields(market: dict, event: dict) -> Optional[dict]:
+    """Extract the raw fields of a market (static part cached per revision)."""
+    static = _cached_static_fields(market, event)
+    if not static:
+        return None
+    live = _extract_live_fields(market)
+    if not live:
+        return None
+    return {**static, **live}
+
+
+def _cached_static_fields(market: dict, event: dict) -> Optional[dict]:
+    """_extract_static_fields, memoized on (market id, updatedAt)."""
+    updated_at = market.get("updatedAt")
+    market_id = market.get("id") or market.get("conditionId")
+    if not updated_at or not market_id:
+        return _extract_static_fields(market, event)
+    
+    key = (str(market_id), updated_at)
+    if key in _PARSE_CACHE:
+        _PARSE_CACHE.move_to_end(key)
+        return _PARSE_CACHE[key]
+    
+    fields = _extract_static_fields(market, event)
+    _PARSE_CACHE[key] = fields
+    if len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+        _PARSE_CACHE.popitem(last=False)
+    return fields
+
+
+def _extract_static_fields(market: dict, event: dict) -> Optional[dict]:
+    """Pull ids, reward parameters and the end date out of a market dict."""
     try:
         # Extract token IDs
         clob_token_ids = market.get("clobTokenIds")
@@ -221,127 +484,178 @@ def parse_market(market: dict, event: dict) -> Optional[RewardMarket]:
         token_id_yes = clob_token_ids[0]
         token_id_no = clob_token_ids[1]
         
-        # ── Rewards info (try multiple field name patterns) ──
-        rewards_daily = 0
-        max_spread = 0
-        min_size = 0
-        
-        # Pattern 1: Top-level camelCase (rewardsMinSize, rewardsMaxSpread)
-        max_spread = float(market.get("rewardsMaxSpread", 0) or 0)
-        min_size = float(market.get("rewardsMinSize", 0) or 0)
-        
-        # Pattern 2: Top-level snake_case
-        if max_spread == 0:
-            max_spread = float(market.get("rewards_max_spread", 0) or 0)
-        if min_size == 0:
-            min_size = float(market.get("rewards_min_size", 0) or 0)
+        # ── Rewards info (field names specialized by _detect_schema) ──
+        max_spread = _first_float(market, _SCHEMA_KEYS["max_spread"])
+        min_size = _first_float(market, _SCHEMA_KEYS["min_size"])
         
-        # Pattern 3: Incentive fields
-        if max_spread == 0:
-            max_spread = float(market.get("max_incentive_spread", 0) or 0)
-        if min_size == 0:
-            min_size = float(market.get("min_incentive_size", 0) or 0)
-        
-        # Pattern 4: Nested "rewards" array with dailyRate
+        # Nested "rewards" array with a daily rate per reward program
+        rewards_daily = 0
         rewards_arr = market.get("rewards", [])
         if isinstance(rewards_arr, list) and rewards_arr:
+            rate_keys = _SCHEMA_KEYS["rate"]
             for r in rewards_arr:
                 if isinstance(r, dict):
-                    rewards_daily += float(r.get("rewardsDailyRate", 0) or r.get("dailyRate", 0) or r.get("rewards_daily_rate", 0) or 0)
+                    rewards_daily += _first_float(r, rate_keys)
         
-        # Pattern 5: Top-level rewardsDailyRate
+        # Top-level daily rate
         if rewards_daily == 0:
-            rewards_daily = float(market.get("rewardsDailyRate", 0) or 0)
-        if rewards_daily == 0:
-            rewards_daily = float(market.get("rewards_daily_rate", 0) or 0)
-        
-        # Pattern 6: "competitive" field can indicate reward activity
-        competitive = float(market.get("competitive", 0) or 0)
+            rewards_daily = _first_float(market, _SCHEMA_KEYS["daily"])
         
         # Convert max_spread from cents to decimal if it looks like cents (> 1)
         if max_spread > 1:
             max_spread = max_spread / 100.0
         
         # ── End date / resolution ──
+        # The scan's end_date_min filter already drops undated markets;
+        # skip any dates we can't place in UTC the same way.
         end_date = market.get("endDate") or event.get("endDate") or market.get("end_date_iso")
-        days_to_resolution = 365  # Default if no end date
-        if end_date:
-            try:
-                end_dt = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
-                now = datetime.now(timezone.utc)
-                days_to_resolution = max(0, (end_dt - now).total_seconds() / 86400)
-            except:
-                pass
+        if not end_date:
+            return None
+        try:
+            end_dt = parse_datetime(end_date) if parse_datetime else None
+        except ValueError:
+            end_dt = None  # Odd format, let the stdlib have a go
+        if end_dt is None:
+            end_dt = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
+        if end_dt.tzinfo is None:  # Naive dates can't be compared to UTC now
+            return None
+        end_ts = end_dt.timestamp()
         
+        return {
+            "condition_id": market.get("conditionId", market.get("condition_id", "")),
+            "question": market.get("question", "Unknown"),
+            "slug": market.get("slug", ""),
+            "token_id_yes": token_id_yes,
+            "token_id_no": token_id_no,
+            "end_date": end_date,
+            "end_ts": end_ts,
+            "daily_reward": rewards_daily,
+            "max_spread": max_spread,
+            "min_size": min_size,
+        }
+    except Exception as e:
+        return None
+
+
+def _extract_live_fields(market: dict) -> Optional[dict]:
+    """Pull prices, book, volume and liquidity out of a market dict."""
+    try:
         # ── Prices ──
         outcome_prices = market.get("outcomePrices", "[]")
         if isinstance(outcome_prices, str):
             try:
-                prices = json.loads(outcome_prices)
-            except:
+                prices = json_loads(outcome_prices)
+            except ValueError:
                 prices = [0.5, 0.5]
         else:
             prices = outcome_prices
         
         yes_price = float(prices[0]) if len(prices) > 0 else 0.5
         no_price = float(prices[1]) if len(prices) > 1 else 0.5
-        midpoint = yes_price
         
         # ── Volume and liquidity ──
         volume_24h = float(market.get("volume24hr", 0) or market.get("volume_num", 0) or 0)
         liquidity = float(market.get("liquidity", 0) or market.get("liquidityNum", 0) or 0)
         
-        # ── Spread ──
+        # ── Book (spread is derived in _score_batch) ──
         best_bid = float(market.get("bestBid", 0) or 0)
         best_ask = float(market.get("bestAsk", 0) or 0)
-        if best_bid > 0 and best_ask > 0:
-            spread = best_ask - best_bid
-        else:
-            spread = abs(yes_price - (1 - no_price)) if no_price else 0
-            best_bid = yes_price - spread / 2
-            best_ask = yes_price + spread / 2
-        
-        # ── Competition score ──
-        if rewards_daily > 0:
-            competition_score = min(100, (liquidity / (rewards_daily * 100)) * 10)
-        else:
-            competition_score = 100
-        
-        # ── Risk score ──
-        time_risk = max(0, 50 - days_to_resolution) * 2
-        price_risk = (1 - abs(midpoint - 0.5) * 2) * 50
-        volume_risk = min(50, volume_24h / 1000 * 10)
-        risk_score = min(100, (time_risk + price_risk + volume_risk) / 3)
         
-        # ── Reward per dollar ──
-        capital_needed = min_size * 2 if min_size > 0 else 100
-        reward_per_dollar = rewards_daily / max(capital_needed, 1) if rewards_daily > 0 else 0
-        
-        return RewardMarket(
-            condition_id=market.get("conditionId", market.get("condition_id", "")),
-            question=market.get("question", "Unknown"),
-            slug=market.get("slug", ""),
-            token_id_yes=token_id_yes,
-            token_id_no=token_id_no,
-            end_date=end_date,
-            days_to_resolution=days_to_resolution,
-            daily_reward=rewards_daily,
-            max_spread=max_spread,
-            min_size=min_size,
-            midpoint=midpoint,
-            best_bid=best_bid,
-            best_ask=best_ask,
-            spread=spread,
-            volume_24h=volume_24h,
-            liquidity=liquidity,
-            competition_score=competition_score,
-            risk_score=risk_score,
-            reward_per_dollar=reward_per_dollar,
-        )
+        return {
+            "yes_price": yes_price,
+            "no_price": no_price,
+            "volume_24h": volume_24h,
+            "liquidity": liquidity,
+            "best_bid": best_bid,
+            "best_ask": best_ask,
+        }
     except Exception as e:
         return None
 
 
+def _score_batch(cols: dict, now_ts: float) -> dict:
+    """
+    Compute spreads and scores for a whole batch of markets at once.
+    Takes float64 arrays keyed by _SCORE_INPUTS, returns float64 arrays.
+    """
+    rewards = cols["daily_reward"]
+    yes_price = cols["yes_price"]
+    no_price = cols["no_price"]
+    midpoint = yes_price
+    
+    # ── End date / resolution ──
+    days = np.maximum(0.0, (cols["end_ts"] - now_ts) / 86400)
+    
+    # ── Spread: use the book if we have one, else derive from outcome prices ──
+    has_book = (cols["best_bid"] > 0) & (cols["best_ask"] > 0)
+    implied = np.where(no_price != 0, np.abs(yes_price - (1 - no_price)), 0.0)
+    spread = np.where(has_book, cols["best_ask"] - cols["best_bid"], implied)
+    best_bid = np.where(has_book, cols["best_bid"], yes_price - spread / 2)
+    best_ask = np.where(has_book, cols["best_ask"], yes_price + spread / 2)
+    
+    has_reward = rewards > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # ── Competition score ──
+        competition = np.where(has_reward, np.minimum(100.0, (cols["liquidity"] / (rewards * 100)) * 10), 100.0)
+    
+    # ── Risk score ──
+    time_risk = np.maximum(0.0, 50 - days) * 2
+    price_risk = (1 - np.abs(midpoint - 0.5) * 2) * 50
+    volume_risk = np.minimum(50.0, cols["volume_24h"] / 1000 * 10)
+    risk = np.minimum(100.0, (time_risk + price_risk + volume_risk) / 3)
+    
+    # ── Reward per dollar ──
+    capital_needed = np.where(cols["min_size"] > 0, cols["min_size"] * 2, 100.0)
+    reward_per_dollar = np.where(has_reward, rewards / np.maximum(capital_needed, 1), 0.0)
+    
+    return {
+        "days_to_resolution": days,
+        "midpoint": midpoint,
+        "best_bid": best_bid,
+        "best_ask": best_ask,
+        "spread": spread,
+        "competition_score": competition,
+        "risk_score": risk,
+        "reward_per_dollar": reward_per_dollar,
+    }
+
+
+def _build_markets(rows: list[dict], now_ts: float) -> list[RewardMarket]:
+    """Score extracted market rows column-wise and build RewardMarkets."""
+    if not rows:
+        return []
+    cols = {
+        name: np.asarray([row[name] for row in rows], dtype=np.float64)
+        for name in _SCORE_INPUTS
+    }
+    scores = {name: arr.tolist() for name, arr in _score_batch(cols, now_ts).items()}
+    
+    return [
+        RewardMarket(
+            condition_id=row["condition_id"],
+            question=row["question"],
+            slug=row["slug"],
+            token_id_yes=row["token_id_yes"],
+            token_id_no=row["token_id_no"],
+            end_date=row["end_date"],
+            days_to_resolution=scores["days_to_resolution"][i],
+            daily_reward=row["daily_reward"],
+            max_spread=row["max_spread"],
+            min_size=row["min_size"],
+            midpoint=scores["midpoint"][i],
+            best_bid=scores["best_bid"][i],
+            best_ask=scores["best_ask"][i],
+            spread=scores["spread"][i],
+            volume_24h=row["volume_24h"],
+            liquidity=row["liquidity"],
+            competition_score=scores["competition_score"][i],
+            risk_score=scores["risk_score"][i],
+            reward_per_dollar=scores["reward_per_dollar"][i],
+        )
+        for i, row in enumerate(rows)
+    ]
+
+
 # ─── Order Management (requires py-clob-client) ─────────────────────────────
 
 def get_clob_client():
@@ -371,6 +685,28 @@ def get_clob_client():
     return client
 
 
+# Only order building/signing (client.create_order) is serialized across
+# the placement threads. Tick size / neg-risk lookups and post_order run
+# concurrently; _order_options does its lookups before taking the lock.
+_SIGN_LOCK = threading.Lock()
+
+
+def _order_options(client, token_id: str):
+    """
+    Look up tick size and neg-risk for token_id outside _SIGN_LOCK, so
+    create_order doesn't fetch them while holding it.
+    """
+    from py_clob_client.clob_types import PartialCreateOrderOptions
+    try:
+        return PartialCreateOrderOptions(
+            tick_size=client.get_tick_size(token_id),
+            neg_risk=client.get_neg_risk(token_id),
+        )
+    except Exception as e:
+        print(f"  ⚠ Order options lookup failed for {token_id[:12]}...: {e}")
+        return None
+
+
 def place_lp_orders(client, market: RewardMarket, size: float) -> tuple:
     """
     Place two-sided limit orders for LP rewards.
@@ -402,6 +738,16 @@ def place_lp_orders(client, market: RewardMarket, size: float) -> tuple:
     
     order_id_yes = None
     order_id_no = None
+    label = market.question[:40]
+    
+    # Look up both legs' order options together, sign under _SIGN_LOCK,
+    # then post both legs together so neither side sits alone on the book.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        opts_yes, opts_no = pool.map(
+            lambda token_id: _order_options(client, token_id),
+            (market.token_id_yes, market.token_id_no),
+        )
+    signed = {}
     
     try:
         # BUY YES at bid (we want to provide liquidity on the buy side)
@@ -411,12 +757,10 @@ def place_lp_orders(client, market: RewardMarket, size: float) -> tuple:
             size=bid_shares,
             side=BUY,
         )
-        signed_buy = client.create_order(buy_order)
-        resp_buy = client.post_order(signed_buy, OrderType.GTC)
-        order_id_yes = resp_buy.get("orderID") or resp_buy.get("id")
-        print(f"  ✅ BUY YES @ {bid_price:.3f} x {bid_shares:.0f} shares")
+        with _SIGN_LOCK:
+            signed["yes"] = client.create_order(buy_order, opts_yes)
     except Exception as e:
-        print(f"  ❌ BUY YES failed: {e}")
+        print(f"  ❌ BUY YES failed: {e} ({label})")
     
     try:
         # BUY NO at (1 - ask_price) which is equivalent to SELL YES
@@ -431,23 +775,80 @@ def place_lp_orders(client, market: RewardMarket, size: float) -> tuple:
             size=no_shares,
             side=BUY,
         )
-        signed_sell = client.create_order(sell_order)
-        resp_sell = client.post_order(signed_sell, OrderType.GTC)
-        order_id_no = resp_sell.get("orderID") or resp_sell.get("id")
-        print(f"  ✅ BUY NO  @ {no_bid_price:.3f} x {no_shares:.0f} shares")
+        with _SIGN_LOCK:
+            signed["no"] = client.create_order(sell_order, opts_no)
     except Exception as e:
-        print(f"  ❌ BUY NO failed: {e}")
+        print(f"  ❌ BUY NO failed: {e} ({label})")
+    
+    if not signed:
+        return order_id_yes, order_id_no
+    
+    with ThreadPoolExecutor(max_workers=len(signed)) as pool:
+        posted = {leg: pool.submit(client.post_order, order, OrderType.GTC) for leg, order in signed.items()}
+    
+    if "yes" in posted:
+        try:
+            resp_buy = posted["yes"].result()
+            order_id_yes = resp_buy.get("orderID") or resp_buy.get("id")
+            print(f"  ✅ BUY YES @ {bid_price:.3f} x {bid_shares:.0f} shares ({label})")
+        except Exception as e:
+            print(f"  ❌ BUY YES failed: {e} ({label})")
+    
+    if "no" in posted:
+        try:
+            resp_sell = posted["no"].result()
+            order_id_no = resp_sell.get("orderID") or resp_sell.get("id")
+            print(f"  ✅ BUY NO  @ {no_bid_price:.3f} x {no_shares:.0f} shares ({label})")
+        except Exception as e:
+            print(f"  ❌ BUY NO failed: {e} ({label})")
     
     return order_id_yes, order_id_no
 
 
-def cancel_order(client, order_id: str):
-    """Cancel an existing order."""
+def _not_canceled(resp) -> dict:
+    """Order ids the CLOB refused to cancel, mapped to its reason."""
+    not_canceled = resp.get("not_canceled") if isinstance(resp, dict) else None
+    if isinstance(not_canceled, dict):
+        return not_canceled
+    return {oid: "" for oid in not_canceled or []}
+
+
+def cancel_order(client, order_id: str) -> bool:
+    """Cancel an existing order. Returns True if it was cancelled."""
     try:
-        client.cancel(order_id)
+        refused = _not_canceled(client.cancel(order_id))
+        if order_id in refused:
+            print(f"  ⚠ Cancel refused for {order_id[:12]}...: {refused[order_id]}")
+            return False
         print(f"  🗑 Cancelled order {order_id[:12]}...")
+        return True
     except Exception as e:
         print(f"  ⚠ Cancel failed for {order_id[:12]}...: {e}")
+        return False
+
+
+def cancel_orders_bulk(client, order_ids: list[str]) -> list[str]:
+    """
+    Cancel several orders in one request, retrying any the CLOB didn't
+    cancel one by one. Returns the ids that are still not cancelled.
+    """
+    order_ids = [oid for oid in order_ids if oid]
+    if not order_ids:
+        return []
+    try:
+        refused = _not_canceled(client.cancel_orders(order_ids))
+        remaining = [oid for oid in order_ids if oid in refused]
+        print(f"  🗑 Cancelled {len(order_ids) - len(remaining)} orders")
+        if remaining:
+            print(f"  ⚠ {len(remaining)} orders not cancelled, retrying individually")
+    except Exception as e:
+        print(f"  ⚠ Bulk cancel failed: {e} (cancelling individually)")
+        remaining = order_ids
+    
+    failed = [oid for oid in remaining if not cancel_order(client, oid)]
+    for order_id in failed:
+        print(f"  ❌ Order {order_id[:12]}... may still be live")
+    return failed
 
 
 def get_open_orders(client) -> list:
@@ -461,33 +862,176 @@ def get_open_orders(client) -> list:
         return []
 
 
+# ─── Midpoint Stream ─────────────────────────────────────────────────────────
+
+# Latest midpoint per token id, written by the websocket thread and read by
+# check_fill_risk. Cleared whenever the stream (re)connects so we never act
+# on prices from a dead connection.
+_MID_CACHE: dict[str, float] = {}
+_WS_ASSETS: frozenset = frozenset()
+_WS_RESUBSCRIBE = threading.Event()
+_WS_THREAD: Optional[threading.Thread] = None
+
+
+def subscribe_midpoints(token_ids: list[str]):
+    """Stream midpoints for token_ids into _MID_CACHE (replaces previous set)."""
+    global _WS_ASSETS, _WS_THREAD
+    if websocket is None:
+        return
+    _WS_ASSETS = frozenset(token_ids)
+    _WS_RESUBSCRIBE.set()
+    if _WS_THREAD is None:
+        _WS_THREAD = threading.Thread(target=_ws_loop, name="midpoint-ws", daemon=True)
+        _WS_THREAD.start()
+
+
+def _ws_loop():
+    """Keep one market-channel websocket open for the subscribed tokens."""
+    while True:
+        _WS_RESUBSCRIBE.wait()
+        _WS_RESUBSCRIBE.clear()
+        _MID_CACHE.clear()
+        assets = sorted(_WS_ASSETS)
+        if not assets:
+            continue
+        
+        try:
+            ws = websocket.create_connection(CLOB_WS_MARKET, timeout=WS_PING_INTERVAL)
+            try:
+                ws.send(json.dumps({"assets_ids": assets, "type": "market"}))
+                last_ping = time.time()
+                while not _WS_RESUBSCRIBE.is_set():
+                    if time.time() - last_ping >= WS_PING_INTERVAL:
+                        ws.send("PING")
+                        last_ping = time.time()
+                    try:
+                        raw = ws.recv()
+                    except websocket.WebSocketTimeoutException:
+                        continue
+                    if not raw:
+                        raise ConnectionError("connection closed by server")
+                    _handle_ws_message(raw)
+            finally:
+                ws.close()
+        except Exception as e:
+            print(f"  ⚠ Midpoint stream error: {e} (reconnecting)")
+            _MID_CACHE.clear()
+            time.sleep(5)
+            _WS_RESUBSCRIBE.set()
+
+
+def _handle_ws_message(raw: str):
+    """Update _MID_CACHE from a market-channel book or price_change event."""
+    try:
+        msg = json_loads(raw)
+    except ValueError:
+        return  # PONG keepalives
+    
+    for event in msg if isinstance(msg, list) else [msg]:
+        if not isinstance(event, dict):
+            continue
+        try:
+            kind = event.get("event_type")
+            if kind == "book":
+                bids = [float(b["price"]) for b in event.get("bids", [])]
+                asks = [float(a["price"]) for a in event.get("asks", [])]
+                if bids and asks:
+                    _MID_CACHE[event["asset_id"]] = (max(bids) + min(asks)) / 2
+            elif kind == "price_change":
+                for change in event.get("price_changes", []):
+                    best_bid = float(change.get("best_bid") or 0)
+                    best_ask = float(change.get("best_ask") or 0)
+                    if best_bid > 0 and best_ask > 0:
+                        _MID_CACHE[change["asset_id"]] = (best_bid + best_ask) / 2
+        except (KeyError, TypeError, ValueError):
+            continue
+
+
 # ─── Fill Monitoring ─────────────────────────────────────────────────────────
 
+# Our bid/ask prices and the latest midpoint of every tracked position, as
+# contiguous float64 columns indexed by ActivePosition.slot.
+# check_fill_risk views them as NumPy arrays without copying.
+_BIDS = array("d")
+_ASKS = array("d")
+_MIDS = array("d")
+
+
+def track_position(pos: ActivePosition):
+    """Give a new position a slot in the price columns."""
+    pos.slot = len(_BIDS)
+    _BIDS.append(pos.our_bid_price)
+    _ASKS.append(pos.our_ask_price)
+    _MIDS.append(pos.market.midpoint)
+
+
+def clear_positions(positions: list[ActivePosition]):
+    """Forget all positions and empty the price columns."""
+    positions.clear()
+    del _BIDS[:], _ASKS[:], _MIDS[:]
+
+
+# Risk labels indexed by how many alert thresholds (1x, 2x, 3x) the closest
+# order is beyond.
+RISK_LEVELS = ("🔴 CRITICAL", "🟡 WARNING", "🟠 WATCH", "🟢 SAFE")
+_RISK_THRESHOLDS = np.array([FILL_ALERT_THRESHOLD, FILL_ALERT_THRESHOLD * 2, FILL_ALERT_THRESHOLD * 3])
+
+
+def _rest_midpoint(market: RewardMarket) -> float:
+    """Current midpoint from the CLOB REST API (market midpoint on error)."""
+    try:
+        mid_resp = clob_get(f"/midpoint", params={"token_id": market.token_id_yes})
+        return float(mid_resp.get("mid", market.midpoint))
+    except:
+        return market.midpoint
+
+
+def _current_midpoints(markets: list[RewardMarket]) -> list[float]:
+    """
+    Streamed midpoints for markets. Tokens the stream hasn't priced yet are
+    fetched over REST concurrently, so a tick costs one round-trip, not N.
+    """
+    mids = [_MID_CACHE.get(m.token_id_yes) for m in markets]
+    missing = [i for i, mid in enumerate(mids) if mid is None]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(len(missing), MIDPOINT_FETCH_WORKERS)) as pool:
+            fetched = pool.map(_rest_midpoint, [markets[i] for i in missing])
+            for i, mid in zip(missing, fetched):
+                mids[i] = mid
+    return mids
+
+
 def check_fill_risk(positions: list[ActivePosition]) -> list[str]:
     """
     Check if any of our orders are at risk of being filled.
     Returns list of alert messages.
     """
     alerts = []
+    if not positions:
+        return alerts
+    
+    current_mids = _current_midpoints([pos.market for pos in positions])
+    for pos, current_mid in zip(positions, current_mids):
+        _MIDS[pos.slot] = current_mid
+    
+    # Check if midpoint has moved toward our orders (all columns by slot)
+    mids = np.frombuffer(_MIDS, dtype=np.float64)
+    bid_dist = np.abs(mids - np.frombuffer(_BIDS, dtype=np.float64))
+    ask_dist = np.abs(mids - np.frombuffer(_ASKS, dtype=np.float64))
+    levels = np.searchsorted(_RISK_THRESHOLDS, np.minimum(bid_dist, ask_dist), side="right").tolist()
+    bid_dist = bid_dist.tolist()
+    ask_dist = ask_dist.tolist()
+    del mids  # Release the buffer view so the columns can grow again
     
-    for pos in positions:
+    for pos, current_mid in zip(positions, current_mids):
+        level = levels[pos.slot]
+        bid_distance = bid_dist[pos.slot]
+        ask_distance = ask_dist[pos.slot]
+        pos.risk_idx = level
+        pos.risk_level = RISK_LEVELS[level]
         market = pos.market
         
-        try:
-            # Get current midpoint from CLOB
-            mid_resp = clob_get(f"/midpoint", params={"token_id": market.token_id_yes})
-            current_mid = float(mid_resp.get("mid", market.midpoint))
-        except:
-            current_mid = market.midpoint
-        
-        # Check if midpoint has moved toward our orders
-        bid_distance = abs(current_mid - pos.our_bid_price)
-        ask_distance = abs(current_mid - pos.our_ask_price)
-        
-        risk_level = "LOW"
-        
-        if bid_distance < FILL_ALERT_THRESHOLD or ask_distance < FILL_ALERT_THRESHOLD:
-            risk_level = "🔴 CRITICAL"
+        if level == 0:
             msg = (
                 f"🚨 <b>FILL RISK - {market.question[:60]}</b>\n"
                 f"Midpoint: {current_mid:.3f}\n"
@@ -497,8 +1041,7 @@ def check_fill_risk(positions: list[ActivePosition]) -> list[str]:
             )
             alerts.append(msg)
             send_telegram(msg)
-        elif bid_distance < FILL_ALERT_THRESHOLD * 2 or ask_distance < FILL_ALERT_THRESHOLD * 2:
-            risk_level = "🟡 WARNING"
+        elif level == 1:
             msg = (
                 f"⚠️ <b>APPROACHING FILL - {market.question[:60]}</b>\n"
                 f"Midpoint: {current_mid:.3f} | "
@@ -506,69 +1049,71 @@ def check_fill_risk(positions: list[ActivePosition]) -> list[str]:
             )
             alerts.append(msg)
             send_telegram(msg)
-        elif bid_distance < FILL_ALERT_THRESHOLD * 3 or ask_distance < FILL_ALERT_THRESHOLD * 3:
-            risk_level = "🟠 WATCH"
-        else:
-            risk_level = "🟢 SAFE"
-        
-        pos.risk_level = risk_level
     
     return alerts
 
 
 # ─── Terminal Dashboard ──────────────────────────────────────────────────────
 
-def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+# ANSI cursor-home + clear-screen, written in front of each dashboard frame
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+# Row templates, bound once so the layout isn't re-parsed on every tick
+_POS_ROW = "║ {:<12}│ {:<39} │ {:.2f} │ ${:5.1f} │ {:5.0f} ║".format
+_OPP_ROW = "║  #{:<4} │ {:<39} │ ${:4.1f} │ {:5.1f} │ {:5.0f} ║".format
+_SCAN_ROW = "  {:<4} {:<45} ${:<7.2f} {:<8.3f} {:<8.1f} {:<6.0f} {:<6.1f}".format
 
 
 def print_dashboard(positions: list[ActivePosition], scan_results: list[RewardMarket] = None):
     """Print a beautiful terminal dashboard."""
-    clear_screen()
-    
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    lines: list[str] = []
     
-    print("╔══════════════════════════════════════════════════════════════════════════════╗")
-    print("║              🏦  POLYMARKET LP REWARDS BOT  🏦                              ║")
-    print(f"║  {now}                                                       ║")
-    print("╠══════════════════════════════════════════════════════════════════════════════╣")
+    lines.append("╔══════════════════════════════════════════════════════════════════════════════╗")
+    lines.append("║              🏦  POLYMARKET LP REWARDS BOT  🏦                              ║")
+    lines.append(f"║  {now}                                                       ║")
+    lines.append("╠══════════════════════════════════════════════════════════════════════════════╣")
     
     if positions:
         # Sort by risk level (highest risk first)
-        risk_order = {"🔴 CRITICAL": 0, "🟡 WARNING": 1, "🟠 WATCH": 2, "🟢 SAFE": 3, "LOW": 4}
-        positions.sort(key=lambda p: risk_order.get(p.risk_level, 5))
+        positions.sort(key=attrgetter("risk_idx"))
         
         total_capital = sum(p.size for p in positions)
         total_rewards = sum(p.market.daily_reward for p in positions)
         
-        print(f"║  💰 Capital Deployed: ${total_capital:,.0f}  |  📈 Est. Daily Rewards: ${total_rewards:,.2f}  ║")
-        print(f"║  📊 Active Positions: {len(positions)}                                                   ║")
-        print("╠══════════════════════════════════════════════════════════════════════════════╣")
-        print("║  RISK  │ MARKET                                    │ MID  │ REWARD │ DAYS  ║")
-        print("╟────────┼───────────────────────────────────────────┼──────┼────────┼───────╢")
+        lines.append(f"║  💰 Capital Deployed: ${total_capital:,.0f}  |  📈 Est. Daily Rewards: ${total_rewards:,.2f}  ║")
+        lines.append(f"║  📊 Active Positions: {len(positions)}                                                   ║")
+        lines.append("╠══════════════════════════════════════════════════════════════════════════════╣")
+        lines.append("║  RISK  │ MARKET                                    │ MID  │ REWARD │ DAYS  ║")
+        lines.append("╟────────┼───────────────────────────────────────────┼──────┼────────┼───────╢")
         
-        for pos in positions:
-            m = pos.market
-            q = m.question[:39].ljust(39)
-            risk = pos.risk_level.ljust(12) if pos.risk_level else "LOW".ljust(12)
-            print(f"║ {risk}│ {q} │ {m.midpoint:.2f} │ ${m.daily_reward:5.1f} │ {m.days_to_resolution:5.0f} ║")
+        lines.extend([
+            _POS_ROW(pos.risk_level or "LOW", pos.market.question[:39], pos.market.midpoint,
+                     pos.market.daily_reward, pos.market.days_to_resolution)
+            for pos in positions
+        ])
     else:
-        print("║  No active positions. Run 'python bot.py run' to start.                   ║")
+        lines.append("║  No active positions. Run 'python bot.py run' to start.                   ║")
     
-    print("╠══════════════════════════════════════════════════════════════════════════════╣")
+    lines.append("╠══════════════════════════════════════════════════════════════════════════════╣")
     
     if scan_results:
-        print("║  🔍 TOP OPPORTUNITIES                                                     ║")
-        print("╟────────┬───────────────────────────────────────────┬──────┬────────┬───────╢")
-        print("║  RANK  │ MARKET                                    │ $/D  │ COMP.  │ DAYS  ║")
-        print("╟────────┼───────────────────────────────────────────┼──────┼────────┼───────╢")
+        lines.append("║  🔍 TOP OPPORTUNITIES                                                     ║")
+        lines.append("╟────────┬───────────────────────────────────────────┬──────┬────────┬───────╢")
+        lines.append("║  RANK  │ MARKET                                    │ $/D  │ COMP.  │ DAYS  ║")
+        lines.append("╟────────┼───────────────────────────────────────────┼──────┼────────┼───────╢")
         
-        for i, m in enumerate(scan_results[:10]):
-            q = m.question[:39].ljust(39)
-            print(f"║  #{i+1:<4} │ {q} │ ${m.daily_reward:4.1f} │ {m.competition_score:5.1f} │ {m.days_to_resolution:5.0f} ║")
+        lines.extend([
+            _OPP_ROW(i + 1, m.question[:39], m.daily_reward, m.competition_score, m.days_to_resolution)
+            for i, m in enumerate(scan_results[:10])
+        ])
+    
+    lines.append("╚══════════════════════════════════════════════════════════════════════════════╝")
+    lines.append(f"\n  Press Ctrl+C to stop  |  Refreshes every {REFRESH_INTERVAL} seconds")
     
-    print("╚══════════════════════════════════════════════════════════════════════════════╝")
-    print("\n  Press Ctrl+C to stop  |  Refreshes every", REFRESH_INTERVAL, "seconds")
+    # Draw the whole frame with a single write
+    sys.stdout.write(CLEAR_SCREEN + "\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def print_scan_results(markets: list[RewardMarket]):
@@ -579,9 +1124,11 @@ def print_scan_results(markets: list[RewardMarket]):
     print(f"  {'#':<4} {'Market':<45} {'$/day':<8} {'Spread':<8} {'Comp.':<8} {'Days':<6} {'Risk':<6}")
     print("-" * 100)
     
-    for i, m in enumerate(markets[:20]):
-        q = m.question[:43]
-        print(f"  {i+1:<4} {q:<45} ${m.daily_reward:<7.2f} {m.max_spread:<8.3f} {m.competition_score:<8.1f} {m.days_to_resolution:<6.0f} {m.risk_score:<6.1f}")
+    print("\n".join([
+        _SCAN_ROW(i + 1, m.question[:43], m.daily_reward, m.max_spread,
+                  m.competition_score, m.days_to_resolution, m.risk_score)
+        for i, m in enumerate(markets[:20])
+    ]))
     
     print("-" * 100)
     print(f"\n  Filters: min {MIN_DAYS_TO_RESOLUTION}d to resolution | min ${MIN_DAILY_REWARD}/day reward | max {MAX_COMPETITION_SCORE} competition")
@@ -652,6 +1199,24 @@ STEP 5: Start the bot!
 
 # ─── Main Bot Loop ───────────────────────────────────────────────────────────
 
+def _open_position(positions: list[ActivePosition], market: RewardMarket, oid_yes: Optional[str], oid_no: Optional[str]):
+    """Record the orders just placed on a market as an active position."""
+    mid = market.midpoint
+    max_sp = market.max_spread
+    
+    pos = ActivePosition(
+        market=market,
+        order_id_yes=oid_yes,
+        order_id_no=oid_no,
+        our_bid_price=round(mid - max_sp + SPREAD_SAFETY_MARGIN, 3),
+        our_ask_price=round(mid + max_sp - SPREAD_SAFETY_MARGIN, 3),
+        size=DEFAULT_SIZE_PER_MARKET,
+        placed_at=datetime.now(timezone.utc).isoformat(),
+    )
+    track_position(pos)
+    positions.append(pos)
+
+
 def run_bot():
     """Main bot loop: scan → place orders → monitor → repeat."""
     print("\n🚀 Starting Polymarket LP Rewards Bot...\n")
@@ -663,17 +1228,30 @@ def run_bot():
     send_telegram("🚀 <b>LP Bot Started</b>\nScanning for opportunities...")
     
     positions: list[ActivePosition] = []
+    placing: dict = {}  # Order placement futures not yet turned into positions
     running = True
     
     def handle_signal(sig, frame):
         nonlocal running
         print("\n\n  🛑 Shutting down... cancelling all orders...")
-        for pos in positions:
-            if pos.order_id_yes:
-                cancel_order(client, pos.order_id_yes)
-            if pos.order_id_no:
-                cancel_order(client, pos.order_id_no)
-        send_telegram("🛑 <b>LP Bot Stopped</b>\nAll orders cancelled.")
+        order_ids = [oid for p in positions for oid in (p.order_id_yes, p.order_id_no)]
+        # Drop queued placements and wait for in-flight ones so their orders get cancelled too
+        for future in list(placing):
+            if future.cancel():
+                continue
+            try:
+                order_ids.extend(future.result())
+            except Exception:
+                pass
+        failed = cancel_orders_bulk(client, list(dict.fromkeys(order_ids)))
+        if failed:
+            send_telegram(
+                f"🛑 <b>LP Bot Stopped</b>\n⚠️ {len(failed)} order(s) could not be cancelled:\n"
+                + "\n".join(failed)
+            )
+        else:
+            send_telegram("🛑 <b>LP Bot Stopped</b>\nAll orders cancelled.")
+        flush_telegram()
         running = False
         sys.exit(0)
     
@@ -695,35 +1273,38 @@ def run_bot():
                     # Cancel existing orders if we're refreshing
                     if positions:
                         print("\n  🔄 Refreshing positions...")
-                        for pos in positions:
-                            if pos.order_id_yes:
-                                cancel_order(client, pos.order_id_yes)
-                            if pos.order_id_no:
-                                cancel_order(client, pos.order_id_no)
-                        positions.clear()
+                        failed = cancel_orders_bulk(client, [oid for p in positions for oid in (p.order_id_yes, p.order_id_no)])
+                        if failed:
+                            send_telegram(f"⚠️ <b>{len(failed)} order(s) could not be cancelled on refresh</b>\n" + "\n".join(failed))
+                        clear_positions(positions)
                     
-                    # Place orders on top markets
-                    for market in markets[:MAX_MARKETS]:
+                    # Place orders on top markets, all markets at once
+                    selected = markets[:MAX_MARKETS]
+                    for market in selected:
                         print(f"\n  📌 {market.question[:60]}")
                         print(f"     Reward: ${market.daily_reward:.2f}/day | "
                               f"Spread: {market.max_spread:.3f} | "
                               f"Days: {market.days_to_resolution:.0f}")
-                        
-                        oid_yes, oid_no = place_lp_orders(client, market, DEFAULT_SIZE_PER_MARKET)
-                        
-                        mid = market.midpoint
-                        max_sp = market.max_spread
-                        
-                        pos = ActivePosition(
-                            market=market,
-                            order_id_yes=oid_yes,
-                            order_id_no=oid_no,
-                            our_bid_price=round(mid - max_sp + SPREAD_SAFETY_MARGIN, 3),
-                            our_ask_price=round(mid + max_sp - SPREAD_SAFETY_MARGIN, 3),
-                            size=DEFAULT_SIZE_PER_MARKET,
-                            placed_at=datetime.now(timezone.utc).isoformat(),
-                        )
-                        positions.append(pos)
+                    print()
+                    
+                    # Each market becomes a position as soon as its orders are posted,
+                    # so a shutdown mid-placement can still cancel them
+                    if selected:
+                        with ThreadPoolExecutor(max_workers=min(len(selected), ORDER_PLACEMENT_WORKERS)) as pool:
+                            for market in selected:
+                                placing[pool.submit(place_lp_orders, client, market, DEFAULT_SIZE_PER_MARKET)] = market
+                            for future in as_completed(list(placing)):
+                                market = placing[future]
+                                try:
+                                    oid_yes, oid_no = future.result()
+                                except Exception as e:
+                                    print(f"  ❌ Order placement failed: {e} ({market.question[:40]})")
+                                    del placing[future]
+                                    continue
+                                _open_position(positions, market, oid_yes, oid_no)
+                                del placing[future]
+                    
+                    subscribe_midpoints([p.market.token_id_yes for p in positions])
                     
                     total_reward = sum(p.market.daily_reward for p in positions)
                     send_telegram(